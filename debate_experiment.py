@@ -1,12 +1,18 @@
+import asyncio
+import hashlib
 import json
 import os
+import re
+import secrets
 import time
+from collections import Counter
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Tuple
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 
-from nanoid import generate
-from openai import OpenAI
+import orjson
+from openai import AsyncOpenAI
 from dotenv import load_dotenv
 
 OUTPUT_DIR = Path("outputs")
@@ -16,6 +22,19 @@ TEMPERATURE = 0.7
 
 LANG = "en"
 
+ROUND_FILES = (
+    "round1_opening.txt",
+    "round2_rebuttal.txt",
+    "round3_assumptions.txt",
+    "round4_closing.txt",
+)
+ROUND_PREFIXES = tuple(f"Round {i}:\n" for i in range(1, len(ROUND_FILES) + 1))
+
+PLACEHOLDER_PATTERN = re.compile(r"\{\{(\w+)\}\}")
+CODE_FENCE_PATTERN = re.compile(r"^\s*```(?:json)?|```\s*$")
+
+VALID_SIDES = frozenset(("Side A", "Side B"))
+
 OUTPUT_DIR.mkdir(exist_ok=True)
 
 def get_api_key() -> str:
@@ -29,7 +48,16 @@ def require_env(key: str) -> str:
     return value
 
 
-def resolve_backend(role: str) -> Dict[str, object]:
+@dataclass(slots=True, frozen=True)
+class BackendCfg:
+    model: str
+    backend: str
+    base_url: str
+    requires_api_key: bool
+    client: Optional[AsyncOpenAI] = None
+
+
+def resolve_backend(role: str) -> BackendCfg:
     backend = require_env(f"{role}_BACKEND").strip().lower()
     if backend not in {"local", "online"}:
         raise ValueError(f"{role}_BACKEND must be 'local' or 'online'.")
@@ -39,28 +67,29 @@ def resolve_backend(role: str) -> Dict[str, object]:
     )
     model_name = require_env(f"{role}_MODEL")
 
-    return {
-        "backend": backend,
-        "base_url": base_url,
-        "model": model_name,
-        "requires_api_key": backend == "online",
-    }
+    return BackendCfg(
+        model=model_name,
+        backend=backend,
+        base_url=base_url,
+        requires_api_key=backend == "online",
+    )
 
 
-def build_client(base_url: str, requires_api_key: bool) -> OpenAI:
+@lru_cache(maxsize=None)
+def build_client(base_url: str, requires_api_key: bool) -> AsyncOpenAI:
     api_key = get_api_key()
     if requires_api_key and not api_key:
         raise ValueError(
             "API key is required for online backends. Set API_KEY or OPENAI_API_KEY."
         )
-    return OpenAI(base_url=base_url, api_key=api_key or "no-need-api-key")
+    return AsyncOpenAI(base_url=base_url, api_key=api_key or "no-need-api-key")
 
 
 def parse_list_env(key: str) -> List[str]:
     return [item.strip() for item in require_env(key).split(",") if item.strip()]
 
 
-def build_judge_configs() -> List[Dict[str, object]]:
+def build_judge_configs() -> List[BackendCfg]:
     models = parse_list_env("JUDGE_MODELS")
     backends = parse_list_env("JUDGE_BACKENDS")
     if len(models) != len(backends):
@@ -73,32 +102,33 @@ def build_judge_configs() -> List[Dict[str, object]]:
         base_url = require_env(
             "LOCAL_BASE_URL" if backend == "local" else "ONLINE_BASE_URL"
         )
-        configs.append({
-            "model": model,
-            "backend": backend,
-            "base_url": base_url,
-            "requires_api_key": backend == "online",
-        })
+        configs.append(BackendCfg(
+            model=model,
+            backend=backend,
+            base_url=base_url,
+            requires_api_key=backend == "online",
+        ))
     return configs
 
 def log(message: str) -> None:
-    timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime())
     print(f"[{timestamp} UTC] {message}")
 
 
+@lru_cache(maxsize=None)
 def load_prompt(name: str) -> str:
     return (PROMPT_DIR / name).read_text(encoding="utf-8")
 
 
 def render_prompt(template: str, variables: Dict[str, str]) -> str:
-    result = template
-    for key, value in variables.items():
-        result = result.replace(f"{{{{{key}}}}}", value)
-    return result
+    return PLACEHOLDER_PATTERN.sub(
+        lambda match: variables.get(match.group(1), match.group(0)),
+        template,
+    )
 
 
-def call_model(client: OpenAI, model: str, messages: List[Dict]) -> Dict:
-    response = client.chat.completions.create(
+async def call_model(client: AsyncOpenAI, model: str, messages: List[Dict]) -> Dict:
+    response = await client.chat.completions.create(
         model=model,
         messages=messages,
         temperature=TEMPERATURE,
@@ -110,17 +140,27 @@ def call_model(client: OpenAI, model: str, messages: List[Dict]) -> Dict:
     }
 
 
+async def timed_call(client: AsyncOpenAI, model: str, messages: List[Dict]) -> Tuple[Dict, float]:
+    started = time.time()
+    result = await call_model(client, model, messages)
+    return result, time.time() - started
+
+
 def save_jsonl(records: List[Dict], filename: Path):
-    with filename.open("a+", encoding="utf-8") as f:
-        for record in records:
-            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    payload = b"".join(
+        orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+        for record in records
+    )
+    with filename.open("ab") as f:
+        f.write(payload)
 
 
 def merge_responses(history: List[Dict]) -> str:
-    return "\n\n".join(
-        f"Round {i+1}:\n{item['content']}"
-        for i, item in enumerate(history)
-    )
+    parts = []
+    for i, item in enumerate(history):
+        prefix = ROUND_PREFIXES[i] if i < len(ROUND_PREFIXES) else f"Round {i+1}:\n"
+        parts.append(prefix + (item["content"] or ""))
+    return "\n\n".join(parts)
 
 
 def build_opponent_variables(
@@ -137,59 +177,94 @@ def build_opponent_variables(
     return {key: opponent_history[target_index]["content"]}
 
 
-def unique_id(seen: set) -> str:
-    while True:
-        uid = generate(size=16, alphabet="0123456789abcdefghijklmnopqrstuvwxyz")
-        if uid not in seen:
-            seen.add(uid)
-            return uid
+@dataclass(slots=True)
+class Usage:
+    cost: float = 0.0
+    completion_tokens: int = 0
+    prompt_tokens: int = 0
+    total_tokens: int = 0
+    reasoning: str = ""
+    reasoning_tokens: int = 0
 
 
-def extract_usage_fields(usage: Dict) -> Tuple[float, int, int, int, str, int]:
+def extract_usage_fields(usage: Optional[Dict]) -> Usage:
     if not usage:
-        return 0.0, 0, 0, 0, "", 0
-    cost = usage.get("total_cost")
+        return Usage()
+    get = usage.get
+    cost = get("total_cost")
     if cost is None:
-        cost = usage.get("cost", 0.0)
-    return (
-        float(cost or 0.0),
-        int(usage.get("completion_tokens") or 0),
-        int(usage.get("prompt_tokens") or 0),
-        int(usage.get("total_tokens") or 0),
-        "",
-        int(usage.get("reasoning_tokens") or 0),
+        cost = get("cost")
+    return Usage(
+        cost=float(cost or 0.0),
+        completion_tokens=int(get("completion_tokens") or 0),
+        prompt_tokens=int(get("prompt_tokens") or 0),
+        total_tokens=int(get("total_tokens") or 0),
+        reasoning_tokens=int(get("reasoning_tokens") or 0),
+    )
+
+
+def sum_usage(usages: List[Usage]) -> Usage:
+    return Usage(
+        cost=sum(usage.cost for usage in usages),
+        completion_tokens=sum(usage.completion_tokens for usage in usages),
+        prompt_tokens=sum(usage.prompt_tokens for usage in usages),
+        total_tokens=sum(usage.total_tokens for usage in usages),
+        reasoning_tokens=sum(usage.reasoning_tokens for usage in usages),
     )
 
 
+def strip_code_fence(text: str) -> str:
+    return CODE_FENCE_PATTERN.sub("", text)
+
+
+def load_json(text: str):
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        return json.loads(text)
+
+
 def parse_jury_response(text: str) -> Dict:
-    if not text:
+    if not text or "{" not in text:
         return {}
-    cleaned = text.strip()
-    if cleaned.startswith("```"):
-        cleaned = cleaned.strip("`")
-        if cleaned.startswith("json"):
-            cleaned = cleaned[4:].lstrip()
     try:
-        return json.loads(cleaned)
+        return load_json(strip_code_fence(text))
     except json.JSONDecodeError:
         return {}
 
 
-def run_jury_evaluation(
-    client: OpenAI,
+def split_jury_batch_response(text: str, judge_count: int) -> List[str]:
+    verdicts = []
+    if text:
+        try:
+            parsed = load_json(strip_code_fence(text))
+        except json.JSONDecodeError:
+            parsed = []
+        if isinstance(parsed, dict):
+            parsed = [parsed]
+        if isinstance(parsed, list):
+            verdicts = [
+                orjson.dumps(item).decode("utf-8")
+                for item in parsed[:judge_count]
+                if isinstance(item, dict)
+            ]
+    return verdicts + [""] * (judge_count - len(verdicts))
+
+
+async def run_jury_evaluation(
+    client: AsyncOpenAI,
     judge_model: str,
     topic: str,
     conditions: str,
     lang: str,
-    history_a: List[Dict],
-    history_b: List[Dict],
+    side_a_text: str,
+    side_b_text: str,
     blind: bool,
-):
+    judge_count: int = 1,
+) -> Tuple[Optional[Dict], List[Dict]]:
     judge_template = load_prompt("judge/judge_evaluation.txt")
-    log("Running jury evaluation.")
+    log(f"Running jury evaluation with {judge_model} for {judge_count} judge(s).")
 
-    side_a_text = merge_responses(history_a)
-    side_b_text = merge_responses(history_b)
     side_map = {"A": "A", "B": "B"}
     if blind:
         side_a_text, side_b_text = side_b_text, side_a_text
@@ -205,21 +280,36 @@ def run_jury_evaluation(
             "SIDE_B_TEXT": side_b_text,
         },
     )
+    if judge_count > 1:
+        batch_template = load_prompt("judge/judge_batch.txt")
+        rendered_prompt += "\n\n" + render_prompt(
+            batch_template, {"JUDGE_COUNT": str(judge_count)}
+        )
+    else:
+        rendered_prompt += "\n\n" + load_prompt("judge/judge_single.txt")
 
     messages = [
         {"role": "system", "content": "You are a neutral debate judge."},
         {"role": "user", "content": rendered_prompt},
     ]
 
-    result = call_model(client, judge_model, messages)
+    result = await call_model(client, judge_model, messages)
 
-    return {
-        "judge_model": judge_model,
-        "side_map": side_map,
-        "prompt": rendered_prompt,
-        "raw_response": result["content"],
-        "usage": result["usage"],
-    }
+    if judge_count > 1:
+        raw_responses = split_jury_batch_response(result["content"], judge_count)
+    else:
+        raw_responses = [result["content"]]
+
+    # The batched call is billed once, so its usage is returned alongside the verdicts.
+    return result["usage"], [
+        {
+            "judge_model": judge_model,
+            "side_map": side_map,
+            "prompt": rendered_prompt,
+            "raw_response": raw_response,
+        }
+        for raw_response in raw_responses
+    ]
 
 
 def remap_winner(raw_winner: str, side_map: Dict[str, str]) -> str:
@@ -233,30 +323,30 @@ def remap_winner(raw_winner: str, side_map: Dict[str, str]) -> str:
 def normalize_jury_scores(parsed: Dict, side_map: Dict[str, str]) -> Dict:
     if side_map.get("A") == "A":
         return parsed
-    return {
-        "total_score_A": parsed.get("total_score_B"),
-        "total_score_B": parsed.get("total_score_A"),
-        "detailed_scores_A": parsed.get("detailed_scores_B"),
-        "detailed_scores_B": parsed.get("detailed_scores_A"),
-        "winner": parsed.get("winner"),
-        "reasoning": parsed.get("reasoning"),
-        "general": parsed.get("general"),
-    }
+    parsed["total_score_A"], parsed["total_score_B"] = (
+        parsed.get("total_score_B"),
+        parsed.get("total_score_A"),
+    )
+    parsed["detailed_scores_A"], parsed["detailed_scores_B"] = (
+        parsed.get("detailed_scores_B"),
+        parsed.get("detailed_scores_A"),
+    )
+    return parsed
 
 
 def is_valid_jury(parsed: Dict) -> bool:
     if not parsed:
         return False
-    if parsed.get("winner") not in {"Side A", "Side B"}:
-        return False
+    get = parsed.get
     return (
-        parsed.get("total_score_A") is not None
-        and parsed.get("total_score_B") is not None
+        get("winner") in VALID_SIDES
+        and get("total_score_A") is not None
+        and get("total_score_B") is not None
     )
-def run_debate(
-    client_a: OpenAI,
-    client_b: OpenAI,
-    judge_configs: List[Dict[str, object]],
+async def run_debate(
+    client_a: AsyncOpenAI,
+    client_b: AsyncOpenAI,
+    judge_configs: List[BackendCfg],
     model_a: str,
     model_b: str,
     topic: str,
@@ -264,20 +354,13 @@ def run_debate(
     lang: str,
     blind_jury: bool,
 ):
-    rounds = [
-        "round1_opening.txt",
-        "round2_rebuttal.txt",
-        "round3_assumptions.txt",
-        "round4_closing.txt",
-    ]
-
     start_time = time.time()
     log(f"Debate started with topic: {topic}")
     log(
         "Models: "
         f"A={model_a}, "
         f"B={model_b}, "
-        f"Judge={','.join(cfg['model'] for cfg in judge_configs)}"
+        f"Judge={','.join(cfg.model for cfg in judge_configs)}"
     )
 
     history_a = []
@@ -285,17 +368,13 @@ def run_debate(
     messages_a = []
     messages_b = []
     rounds_log = []
-    total_cost = 0.0
-    total_completion_tokens = 0
-    total_prompt_tokens = 0
-    total_tokens = 0
-    total_reasoning_tokens = 0
+    call_usages = []
 
     system_prompt = load_prompt("system.txt")
     messages_a.append({"role": "system", "content": system_prompt})
     messages_b.append({"role": "system", "content": system_prompt})
 
-    for i, round_file in enumerate(rounds, start=1):
+    for i, round_file in enumerate(ROUND_FILES, start=1):
         round_template_a = load_prompt(f"model_a/{round_file}")
         round_template_b = load_prompt(f"model_b/{round_file}")
 
@@ -305,110 +384,102 @@ def run_debate(
         variables_a.update(build_opponent_variables(i, history_b, "MODEL_B"))
         prompt_a = render_prompt(round_template_a, variables_a)
         messages_a.append({"role": "user", "content": prompt_a})
-        log(f"Calling model A for round {i}.")
-        round_start_a = time.time()
-        result_a = call_model(client_a, model_a, messages_a)
-        round_duration_a = time.time() - round_start_a
-        log(f"Model A completed round {i}.")
+
+        variables_b = {"TOPIC": topic, "CONDITIONS": conditions, "LANG": lang}
+        variables_b.update(build_opponent_variables(i, history_a, "MODEL_A"))
+        prompt_b = render_prompt(round_template_b, variables_b)
+        messages_b.append({"role": "user", "content": prompt_b})
+
+        log(f"Calling models A and B for round {i}.")
+        (result_a, round_duration_a), (result_b, round_duration_b) = await asyncio.gather(
+            timed_call(client_a, model_a, messages_a),
+            timed_call(client_b, model_b, messages_b),
+        )
+        log(f"Models A and B completed round {i}.")
         history_a.append(result_a)
         messages_a.append({"role": "assistant", "content": result_a.get("content") or ""})
+        history_b.append(result_b)
+        messages_b.append({"role": "assistant", "content": result_b.get("content") or ""})
 
-        (
-            cost_a,
-            completion_tokens_a,
-            prompt_tokens_a,
-            total_tokens_a,
-            reasoning_a,
-            reasoning_tokens_a,
-        ) = extract_usage_fields(result_a.get("usage"))
+        usage_a = extract_usage_fields(result_a.get("usage"))
         rounds_log.append({
             "id": i,
             "side": "A",
-            "prompt": prompt_a,
+            "prompt_template": f"model_a/{round_file}",
+            "prompt_vars": variables_a,
+            "prompt_sha256": hashlib.sha256(prompt_a.encode("utf-8")).hexdigest(),
             "content": result_a.get("content") or "",
-            "cost": cost_a,
-            "completion_tokens": completion_tokens_a,
-            "prompt_tokens": prompt_tokens_a,
-            "total_tokens": total_tokens_a,
-            "reasoning": reasoning_a,
-            "reasoning_tokens": reasoning_tokens_a,
+            "cost": usage_a.cost,
+            "completion_tokens": usage_a.completion_tokens,
+            "prompt_tokens": usage_a.prompt_tokens,
+            "total_tokens": usage_a.total_tokens,
+            "reasoning": usage_a.reasoning,
+            "reasoning_tokens": usage_a.reasoning_tokens,
             "duration_seconds": round_duration_a,
         })
-        total_cost += cost_a
-        total_completion_tokens += completion_tokens_a
-        total_prompt_tokens += prompt_tokens_a
-        total_tokens += total_tokens_a
-        total_reasoning_tokens += reasoning_tokens_a
-
-        time.sleep(1)
-
-        variables_b = {"TOPIC": topic, "CONDITIONS": conditions, "LANG": lang}
-        variables_b.update(build_opponent_variables(i, history_a, "MODEL_A"))
-        prompt_b = render_prompt(round_template_b, variables_b)
-        messages_b.append({"role": "user", "content": prompt_b})
-        log(f"Calling model B for round {i}.")
-        round_start_b = time.time()
-        result_b = call_model(client_b, model_b, messages_b)
-        round_duration_b = time.time() - round_start_b
-        log(f"Model B completed round {i}.")
-        history_b.append(result_b)
-        messages_b.append({"role": "assistant", "content": result_b.get("content") or ""})
+        call_usages.append(usage_a)
 
-        (
-            cost_b,
-            completion_tokens_b,
-            prompt_tokens_b,
-            total_tokens_b,
-            reasoning_b,
-            reasoning_tokens_b,
-        ) = extract_usage_fields(result_b.get("usage"))
+        usage_b = extract_usage_fields(result_b.get("usage"))
         rounds_log.append({
             "id": i,
             "side": "B",
-            "prompt": prompt_b,
+            "prompt_template": f"model_b/{round_file}",
+            "prompt_vars": variables_b,
+            "prompt_sha256": hashlib.sha256(prompt_b.encode("utf-8")).hexdigest(),
             "content": result_b.get("content") or "",
-            "cost": cost_b,
-            "completion_tokens": completion_tokens_b,
-            "prompt_tokens": prompt_tokens_b,
-            "total_tokens": total_tokens_b,
-            "reasoning": reasoning_b,
-            "reasoning_tokens": reasoning_tokens_b,
+            "cost": usage_b.cost,
+            "completion_tokens": usage_b.completion_tokens,
+            "prompt_tokens": usage_b.prompt_tokens,
+            "total_tokens": usage_b.total_tokens,
+            "reasoning": usage_b.reasoning,
+            "reasoning_tokens": usage_b.reasoning_tokens,
             "duration_seconds": round_duration_b,
         })
-        total_cost += cost_b
-        total_completion_tokens += completion_tokens_b
-        total_prompt_tokens += prompt_tokens_b
-        total_tokens += total_tokens_b
-        total_reasoning_tokens += reasoning_tokens_b
+        call_usages.append(usage_b)
 
-        time.sleep(1)
+    side_a_text = merge_responses(history_a)
+    side_b_text = merge_responses(history_b)
 
     jury_results = []
     jury_parsed_list = []
-    for cfg in judge_configs:
-        jury_result = run_jury_evaluation(
-            client=cfg["client"],
-            judge_model=cfg["model"],
-            topic=topic,
-            conditions=conditions,
-            lang=lang,
-            history_a=history_a,
-            history_b=history_b,
-            blind=blind_jury,
-        )
-        (
-            jury_cost,
-            jury_completion_tokens,
-            jury_prompt_tokens,
-            jury_total_tokens,
-            jury_reasoning,
-            jury_reasoning_tokens,
-        ) = extract_usage_fields(jury_result.get("usage"))
-        total_cost += jury_cost
-        total_completion_tokens += jury_completion_tokens
-        total_prompt_tokens += jury_prompt_tokens
-        total_tokens += jury_total_tokens
-        total_reasoning_tokens += jury_reasoning_tokens
+    jury_groups = {}
+    for index, cfg in enumerate(judge_configs):
+        jury_groups.setdefault((cfg.base_url, cfg.model), []).append(index)
+    group_outputs = await asyncio.gather(
+        *(
+            run_jury_evaluation(
+                client=judge_configs[indexes[0]].client,
+                judge_model=judge_configs[indexes[0]].model,
+                topic=topic,
+                conditions=conditions,
+                lang=lang,
+                side_a_text=side_a_text,
+                side_b_text=side_b_text,
+                blind=blind_jury,
+                judge_count=len(indexes),
+            )
+            for indexes in jury_groups.values()
+        ),
+        return_exceptions=True,
+    )
+    jury_raw = [None] * len(judge_configs)
+    unassigned_usages = {}
+    for group_key, output in zip(jury_groups, group_outputs):
+        indexes = jury_groups[group_key]
+        if isinstance(output, Exception):
+            for index in indexes:
+                jury_raw[index] = output
+            continue
+        group_usage, verdicts = output
+        group_usage = extract_usage_fields(group_usage)
+        call_usages.append(group_usage)
+        unassigned_usages[group_key] = group_usage
+        for position, index in enumerate(indexes):
+            jury_raw[index] = verdicts[position]
+    for cfg, jury_result in zip(judge_configs, jury_raw):
+        if isinstance(jury_result, Exception):
+            log(f"Skipping failed jury call for model {cfg.model}: {jury_result}")
+            continue
 
         jury_parsed_raw = parse_jury_response(jury_result.get("raw_response") or "")
         remapped_winner = remap_winner(
@@ -421,40 +492,45 @@ def run_debate(
             jury_result.get("side_map", {"A": "A", "B": "B"}),
         )
         if not is_valid_jury(jury_parsed):
-            log(f"Skipping invalid jury output for model {cfg['model']}.")
+            log(f"Skipping invalid jury output for model {cfg.model}.")
             continue
 
+        # A batched call is booked once, against the first valid verdict of its group.
+        jury_usage = unassigned_usages.pop((cfg.base_url, cfg.model), None) or Usage()
         jury_results.append({
-            "model": cfg["model"],
+            "model": cfg.model,
             "prompt": jury_result.get("prompt") or "",
             "content": jury_result.get("raw_response") or "",
-            "cost": jury_cost,
-            "completion_tokens": jury_completion_tokens,
-            "prompt_tokens": jury_prompt_tokens,
-            "total_tokens": jury_total_tokens,
-            "reasoning": jury_reasoning,
-            "reasoning_tokens": jury_reasoning_tokens,
+            "cost": jury_usage.cost,
+            "completion_tokens": jury_usage.completion_tokens,
+            "prompt_tokens": jury_usage.prompt_tokens,
+            "total_tokens": jury_usage.total_tokens,
+            "reasoning": jury_usage.reasoning,
+            "reasoning_tokens": jury_usage.reasoning_tokens,
             "blind": blind_jury,
             "side_map": jury_result.get("side_map", {"A": "A", "B": "B"}),
         })
         jury_parsed_list.append(jury_parsed)
 
+    totals = sum_usage(call_usages)
     total_duration_seconds = time.time() - start_time
 
-    winners = [item.get("winner") for item in jury_parsed_list if item.get("winner")]
-    winner_counts = {"Side A": winners.count("Side A"), "Side B": winners.count("Side B")}
+    winner_tally = Counter()
+    first_parsed_for_side = {}
+    for parsed in jury_parsed_list:
+        winner = parsed.get("winner")
+        if winner in VALID_SIDES:
+            winner_tally[winner] += 1
+            first_parsed_for_side.setdefault(winner, parsed)
+    winner_counts = {"Side A": winner_tally["Side A"], "Side B": winner_tally["Side B"]}
     final_winner = ""
-    if winners:
+    if winner_tally:
         final_winner = (
             "Side A" if winner_counts["Side A"] >= winner_counts["Side B"] else "Side B"
         )
-    winner_reason = ""
-    general_summary = ""
-    for parsed in jury_parsed_list:
-        if parsed.get("winner") == final_winner:
-            winner_reason = parsed.get("reasoning", "") or winner_reason
-            general_summary = parsed.get("general", "") or general_summary
-            break
+    winning_parsed = first_parsed_for_side.get(final_winner, {})
+    winner_reason = winning_parsed.get("reasoning") or ""
+    general_summary = winning_parsed.get("general") or ""
 
     evaluation = {
         "juries": jury_results,
@@ -464,15 +540,14 @@ def run_debate(
 
     output_file = OUTPUT_DIR / "out.jsonl"
 
-    seen_ids = set()
     record = {
-        "id": unique_id(seen_ids),
+        "id": secrets.token_hex(8),
         "topic": topic,
         "conditions": conditions,
         "lang": lang_code,
         "proposition": model_a,
         "opposition": model_b,
-        "jury": ",".join(cfg["model"] for cfg in judge_configs),
+        "jury": ",".join(cfg.model for cfg in judge_configs),
         "rounds": rounds_log,
         "evaluation": evaluation,
         "result": {
@@ -480,11 +555,11 @@ def run_debate(
             "winner": final_winner,
             "winning_reason": winner_reason,
         },
-        "total_cost": total_cost,
-        "total_completion_tokens": total_completion_tokens,
-        "total_prompt_tokens": total_prompt_tokens,
-        "total_tokens": total_tokens,
-        "total_reasoning_tokens": total_reasoning_tokens,
+        "total_cost": totals.cost,
+        "total_completion_tokens": totals.completion_tokens,
+        "total_prompt_tokens": totals.prompt_tokens,
+        "total_tokens": totals.total_tokens,
+        "total_reasoning_tokens": totals.reasoning_tokens,
         "total_duration_seconds": total_duration_seconds,
     }
     save_jsonl([record], output_file)
@@ -512,44 +587,39 @@ if __name__ == "__main__":
     blind_jury = os.getenv("JUDGE_BLIND", "true").strip().lower() == "true"
 
     client_a = build_client(
-        model_a_config["base_url"],
-        model_a_config["requires_api_key"],
+        model_a_config.base_url,
+        model_a_config.requires_api_key,
     )
     client_b = build_client(
-        model_b_config["base_url"],
-        model_b_config["requires_api_key"],
+        model_b_config.base_url,
+        model_b_config.requires_api_key,
     )
-    judge_clients = {}
-    for cfg in judge_configs:
-        key = (cfg["base_url"], cfg["requires_api_key"])
-        if key not in judge_clients:
-            judge_clients[key] = build_client(
-                cfg["base_url"],
-                cfg["requires_api_key"],
-            )
-        cfg["client"] = judge_clients[key]
+    judge_configs = [
+        replace(cfg, client=build_client(cfg.base_url, cfg.requires_api_key))
+        for cfg in judge_configs
+    ]
 
     log(
         "Backends: "
-        f"A={model_a_config['backend']} "
-        f"B={model_b_config['backend']} "
-        f"Judge={','.join(cfg['backend'] for cfg in judge_configs)}"
+        f"A={model_a_config.backend} "
+        f"B={model_b_config.backend} "
+        f"Judge={','.join(cfg.backend for cfg in judge_configs)}"
     )
     log(
         "Base URLs: "
-        f"A={model_a_config['base_url']} "
-        f"B={model_b_config['base_url']} "
-        f"Judge={','.join(cfg['base_url'] for cfg in judge_configs)}"
+        f"A={model_a_config.base_url} "
+        f"B={model_b_config.base_url} "
+        f"Judge={','.join(cfg.base_url for cfg in judge_configs)}"
     )
 
-    run_debate(
+    asyncio.run(run_debate(
         client_a,
         client_b,
         judge_configs,
-        model_a_config["model"],
-        model_b_config["model"],
+        model_a_config.model,
+        model_b_config.model,
         topic,
         conditions,
         lang,
         blind_jury,
-    )
+    ))
@@ -1,10 +1,26 @@
 import argparse
+import gzip
+import hashlib
 import html
 import json
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from string import Template
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+PROMPT_DIR = Path(__file__).resolve().parent / "prompts"
+PLACEHOLDER_PATTERN = re.compile(r"\{\{(\w+)\}\}")
+NON_SPACE_WHITESPACE = [
+    chr(code) for code in range(0x3001) if chr(code).isspace() and code != 0x20
+]
 
 CRITERIA = [
     ("conceptual_clarity", "Conceptual clarity"),
@@ -15,27 +31,350 @@ CRITERIA = [
     ("synthesis_and_inference_skills", "Synthesis and inference skills"),
 ]
 
+CRITERIA_ROWS_HTML = "".join(
+    f"<tr><td>{html.escape(label)}</td>"
+    f'<td><input type="number" name="a_{key}" min="0" max="20" required></td>'
+    f'<td><input type="number" name="b_{key}" min="0" max="20" required></td></tr>'
+    for key, label in CRITERIA
+)
+
+ROUND_TITLES = {
+    1: ("Opening", "Initial arguments without rebuttal."),
+    2: ("Rebuttal", "Direct response to the opposing opening."),
+    3: ("Assumptions", "Analyze framing and hidden assumptions."),
+    4: ("Closing", "Synthesis and final position."),
+}
+
+ROUND_TEMPLATE = """
+<div class="round">
+  <div class="round-header">
+    Round %(round_id)s - %(title)s
+    <div class="round-desc">%(desc)s</div>
+  </div>
+  <div class="prompt-row">
+    <details class="panel prompt">
+      <summary class="panel-title"><span class="toggle-icon"></span> Prompt A</summary>
+      <pre>%(prompt_a)s</pre>
+    </details>
+  </div>
+  <div class="response-row response-a">
+    <div class="panel side-a">
+      <div class="panel-title">Model A</div>
+      <pre class="model-output">%(content_a)s</pre>
+      %(reasoning_a)s
+    </div>
+  </div>
+  <div class="prompt-row">
+    <details class="panel prompt">
+      <summary class="panel-title"><span class="toggle-icon"></span> Prompt B</summary>
+      <pre>%(prompt_b)s</pre>
+    </details>
+  </div>
+  <div class="response-row response-b">
+    <div class="panel side-b">
+      <div class="panel-title">Model B</div>
+      <pre class="model-output">%(content_b)s</pre>
+      %(reasoning_b)s
+    </div>
+  </div>
+</div>
+"""
+
+RECORD_TEMPLATE = """
+<section class="debate" id="debate-%(debate_id)s">
+  <div class="meta">
+    <div><strong>Topic:</strong> %(topic)s</div>
+    <div><strong>Conditions:</strong> %(conditions)s</div>
+    <div><strong>Model A:</strong> %(model_a)s</div>
+    <div><strong>Model B:</strong> %(model_b)s</div>
+    <div><strong>Jury:</strong> %(jury_model)s</div>
+    %(duration_line)s
+  </div>
+  <div class="general">
+    <div class="panel-title">General Summary</div>
+    <div class="panel-content">%(general)s</div>
+  </div>
+  <div class="totals-card">
+    <div class="panel-title">Totals</div>
+    <table class="totals">
+      <thead>
+        <tr><th>Model</th><th>Total Tokens</th><th>Total Cost (USD)</th></tr>
+      </thead>
+      <tbody>
+        <tr><td>%(model_a)s</td><td>%(tokens_a)s</td><td>%(cost_a).6f</td></tr>
+        <tr><td>%(model_b)s</td><td>%(tokens_b)s</td><td>%(cost_b).6f</td></tr>
+        %(jury_totals_html)s
+        <tr>
+          <td><strong>Total</strong></td>
+          <td><strong>%(total_tokens_all)s</strong></td>
+          <td><strong>%(total_cost_all).6f</strong></td>
+        </tr>
+      </tbody>
+    </table>
+  </div>
+  %(rounds_html)s
+  <div class="jury">
+    <div class="panel-title">Jury Result</div>
+    <div class="panel-content">
+      %(per_jury_tables_html)s
+      <div class="panel-title">Jury Totals</div>
+      <table class="scores">
+        <thead>
+          <tr><th></th><th>Total Score A</th><th>Total Score B</th></tr>
+        </thead>
+        <tbody>
+          <tr><td>Sum</td><td>%(total_score_a).2f</td><td>%(total_score_b).2f</td></tr>
+          <tr><td>Average</td><td>%(avg_score_a).2f</td><td>%(avg_score_b).2f</td></tr>
+        </tbody>
+      </table>
+      <div class="winner">Winner: %(winner)s</div>
+    </div>
+  </div>
+</section>
+"""
+
+HUMAN_ROUND_TEMPLATE = """
+<div class="round">
+  <div class="round-header">
+    Round %(round_id)s - %(title)s
+    <div class="round-desc">%(desc)s</div>
+  </div>
+  <div class="response-row response-a">
+    <div class="panel side-a">
+      <div class="panel-title">Side A</div>
+      <pre class="model-output">%(content_a)s</pre>
+    </div>
+  </div>
+  <div class="response-row response-b">
+    <div class="panel side-b">
+      <div class="panel-title">Side B</div>
+      <pre class="model-output">%(content_b)s</pre>
+    </div>
+  </div>
+</div>
+"""
+
+HUMAN_RECORD_TEMPLATE = """
+<section class="debate" id="debate-%(debate_id)s">
+  <div class="meta">
+    <div><strong>Topic:</strong> %(topic)s</div>
+    <div><strong>Conditions:</strong> %(conditions)s</div>
+    <div><strong>Participants:</strong> Side A vs Side B</div>
+  </div>
+  %(rounds_html)s
+  <form class="human-form" data-debate-id="%(debate_id)s" data-topic="%(topic)s" data-conditions="%(conditions)s">
+    <div class="panel-title">Human Evaluation</div>
+    <table class="scores">
+      <thead>
+        <tr><th>Criteria</th><th>Side A (0-20)</th><th>Side B (0-20)</th></tr>
+      </thead>
+      <tbody>
+        """ + CRITERIA_ROWS_HTML.replace("%", "%%") + """
+      </tbody>
+    </table>
+    <div class="form-row">
+      <label>Winner (auto)</label>
+      <input type="text" name="winner_display" readonly>
+      <input type="hidden" name="winner">
+    </div>
+    <div class="form-row">
+      <label>Why did Side A or Side B win (or why is it a tie)?</label>
+      <textarea name="reasoning" required minlength="20"></textarea>
+    </div>
+    <div class="form-row">
+      <label>Full Name</label>
+      <input type="text" name="full_name" required>
+    </div>
+    <div class="form-row">
+      <label>Email</label>
+      <input type="email" name="email" required>
+    </div>
+    <div class="form-actions">
+      <button type="submit">Submit</button>
+      <span class="form-status" aria-live="polite"></span>
+    </div>
+  </form>
+</section>
+"""
+
+SIGNATURE_HTML = """      <footer class="signature">
+        Fatih Tatoğlu - <a href="https://tatoglu.net" target="_blank" rel="noopener">https://tatoglu.net</a>
+      </footer>
+    </main>
+  </div>
+"""
+
+MAIN_SCRIPT = """  <script>
+    const items = document.querySelectorAll('.nav-item');
+    const debates = document.querySelectorAll('.debate');
+    function showDebate(id) {
+      debates.forEach((el) => {
+        el.style.display = el.id === id ? 'block' : 'none';
+      });
+      items.forEach((btn) => {
+        btn.classList.toggle('active', btn.dataset.target === id);
+      });
+    }
+    if (items.length) {
+      showDebate(items[0].dataset.target);
+      items.forEach((btn) => {
+        btn.addEventListener('click', () => showDebate(btn.dataset.target));
+      });
+    }
+  </script>
+"""
+
+HUMAN_SCORE_JS = "\n        ".join(
+    f"scores.side_{side}['{key}'] = Number(data.get('{side}_{key}'));"
+    for key, _label in CRITERIA
+    for side in ("a", "b")
+)
+
+HUMAN_SCRIPT = Template("""  <script>
+    const items = document.querySelectorAll('.nav-item');
+    const debates = document.querySelectorAll('.debate');
+    function showDebate(id) {
+      debates.forEach((el) => {
+        el.style.display = el.id === id ? 'block' : 'none';
+      });
+      items.forEach((btn) => {
+        btn.classList.toggle('active', btn.dataset.target === id);
+      });
+    }
+    if (items.length) {
+      showDebate(items[0].dataset.target);
+      items.forEach((btn) => {
+        btn.addEventListener('click', () => showDebate(btn.dataset.target));
+      });
+    }
+
+    document.querySelectorAll('.human-form').forEach((form) => {
+      form.addEventListener('submit', async (e) => {
+        e.preventDefault();
+        const status = form.querySelector('.form-status');
+        status.textContent = 'Submitting...';
+        const data = new FormData(form);
+        const payload = {
+          debate_id: form.dataset.debateId,
+          topic: form.dataset.topic,
+          conditions: form.dataset.conditions,
+          scores: {
+            side_a: {},
+            side_b: {},
+          },
+          winner: data.get('winner'),
+          reasoning: data.get('reasoning'),
+          full_name: data.get('full_name'),
+          email: data.get('email'),
+        };
+        const scores = payload.scores;
+        $SCORE_JS
+        try {
+          const res = await fetch('https://example.com/submit', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(payload),
+          });
+          if (res.ok) {
+            status.textContent = 'Submitted.';
+            form.reset();
+          } else {
+            status.textContent = 'Failed. Please try again.';
+          }
+        } catch (err) {
+          status.textContent = 'Failed. Please try again.';
+        }
+      });
+    });
+
+    function updateWinner(form) {
+      const data = new FormData(form);
+      let totalA = 0;
+      let totalB = 0;
+      const scores = { side_a: {}, side_b: {} };
+      $SCORE_JS
+      Object.values(scores.side_a).forEach((v) => totalA += v);
+      Object.values(scores.side_b).forEach((v) => totalB += v);
+      const winnerField = form.querySelector('input[name="winner"]');
+      const winnerDisplay = form.querySelector('input[name="winner_display"]');
+      if (totalA > totalB) {
+        winnerField.value = 'Side A';
+        winnerDisplay.value = 'Side A';
+      } else if (totalB > totalA) {
+        winnerField.value = 'Side B';
+        winnerDisplay.value = 'Side B';
+      } else {
+        winnerField.value = 'Tie';
+        winnerDisplay.value = 'Tie';
+      }
+    }
+
+    document.querySelectorAll('.human-form').forEach((form) => {
+      form.addEventListener('input', () => updateWinner(form));
+      updateWinner(form);
+    });
+  </script>
+""").substitute(SCORE_JS=HUMAN_SCORE_JS)
+
 
 
 def load_records(path: Path) -> list:
-    records = []
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            records.append(json.loads(line))
-    return records
+    loads = orjson.loads if orjson is not None else json.loads
+    return [loads(line) for line in path.read_bytes().splitlines() if line.strip()]
 
 
 def escape(text: str) -> str:
     return html.escape(text or "")
 
 
-def format_json_block(data) -> str:
-    if data is None:
+def escape_many(values: list) -> list:
+    escaped = escape("\x00".join(values)).split("\x00")
+    if len(escaped) != len(values):
+        return [escape(value) for value in values]
+    return escaped
+
+
+def to_float(value, default=0.0):
+    value_type = type(value)
+    if value_type is float:
+        return value
+    if value_type is int:
+        return float(value)
+    if value_type is str:
+        try:
+            return float(value)
+        except ValueError:
+            return default
+    return default
+
+
+@lru_cache(maxsize=None)
+def load_prompt_template(name: str):
+    path = (PROMPT_DIR / name).resolve()
+    if not name or not path.is_relative_to(PROMPT_DIR) or not path.is_file():
+        return None
+    return path.read_text(encoding="utf-8")
+
+
+def resolve_prompt(item: dict) -> str:
+    if "prompt" in item:
+        return item.get("prompt") or ""
+    name = item.get("prompt_template") or ""
+    if not name:
         return ""
-    return escape(json.dumps(data, ensure_ascii=False, indent=2))
+    template = load_prompt_template(name)
+    if template is None:
+        return f"[Prompt unavailable: template {name!r} not found in {PROMPT_DIR}]"
+    variables = item.get("prompt_vars") or {}
+    prompt = PLACEHOLDER_PATTERN.sub(
+        lambda match: variables.get(match.group(1), match.group(0)),
+        template,
+    )
+    expected_sha256 = item.get("prompt_sha256")
+    actual_sha256 = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    if expected_sha256 and actual_sha256 != expected_sha256:
+        return f"[Prompt unavailable: template {name!r} changed since this debate was recorded]"
+    return prompt
 
 
 def render_reasoning_block(reasoning: str) -> str:
@@ -49,74 +388,63 @@ def render_reasoning_block(reasoning: str) -> str:
     """
 
 
-def group_rounds(rounds: list) -> list:
-    grouped = {}
+def group_rounds(rounds: list, totals: dict = None) -> list:
+    # Round ids up to len(rounds) index a list; larger ids come from malformed
+    # records and are grouped in a dict so they cannot size the list.
+    limit = len(rounds)
+    grouped = []
+    overflow = {}
+    get = dict.get
     for item in rounds:
-        round_id = item.get("id")
-        side = item.get("side")
-        grouped.setdefault(round_id, {})[side] = item
-    return [grouped[key] for key in sorted(grouped.keys())]
+        side = get(item, "side")
+        if totals is not None and side in totals:
+            side_totals = totals[side]
+            side_totals["cost"] += to_float(get(item, "cost"))
+            side_totals["tokens"] += int(to_float(get(item, "total_tokens")))
+        round_id = get(item, "id")
+        if not isinstance(round_id, int) or round_id < 1:
+            continue
+        if round_id > limit:
+            overflow.setdefault(round_id, {})[side] = item
+            continue
+        if round_id > len(grouped):
+            grouped.extend({} for _ in range(round_id - len(grouped)))
+        grouped[round_id - 1][side] = item
+    grouped = [group for group in grouped if group]
+    grouped.extend(overflow[round_id] for round_id in sorted(overflow))
+    return grouped
+
+
+def summarize_rounds(rounds: list) -> tuple:
+    totals = {
+        "A": {"cost": 0.0, "tokens": 0},
+        "B": {"cost": 0.0, "tokens": 0},
+    }
+    return group_rounds(rounds, totals), totals
 
 
 def render_round_block(round_id: int, round_data: dict) -> str:
     a = round_data.get("A", {})
     b = round_data.get("B", {})
-    prompt_a = a.get("prompt", "")
-    prompt_b = b.get("prompt", "")
-    round_titles = {
-        1: ("Opening", "Initial arguments without rebuttal."),
-        2: ("Rebuttal", "Direct response to the opposing opening."),
-        3: ("Assumptions", "Analyze framing and hidden assumptions."),
-        4: ("Closing", "Synthesis and final position."),
-    }
-    title, desc = round_titles.get(
+    title, desc = ROUND_TITLES.get(
         round_id, (f"Round {round_id}", "Response for this round.")
     )
-    return f"""
-    <div class="round">
-      <div class="round-header">
-        Round {round_id} - {escape(title)}
-        <div class="round-desc">{escape(desc)}</div>
-      </div>
-      <div class="prompt-row">
-        <details class="panel prompt">
-          <summary class="panel-title">
-            <span class="toggle-icon"></span>
-            Prompt A
-          </summary>
-          <pre>{escape(prompt_a)}</pre>
-        </details>
-      </div>
-      <div class="response-row response-a">
-        <div class="panel side-a">
-          <div class="panel-title">Model A</div>
-          <pre class="model-output">{escape(a.get("content", ""))}</pre>
-          {render_reasoning_block(a.get("reasoning", ""))}
-        </div>
-      </div>
-      <div class="prompt-row">
-        <details class="panel prompt">
-          <summary class="panel-title">
-            <span class="toggle-icon"></span>
-            Prompt B
-          </summary>
-          <pre>{escape(prompt_b)}</pre>
-        </details>
-      </div>
-      <div class="response-row response-b">
-        <div class="panel side-b">
-          <div class="panel-title">Model B</div>
-          <pre class="model-output">{escape(b.get("content", ""))}</pre>
-          {render_reasoning_block(b.get("reasoning", ""))}
-        </div>
-      </div>
-    </div>
-    """
+    return ROUND_TEMPLATE % {
+        "round_id": round_id,
+        "title": escape(title),
+        "desc": escape(desc),
+        "prompt_a": escape(resolve_prompt(a)),
+        "content_a": escape(a.get("content", "")),
+        "reasoning_a": render_reasoning_block(a.get("reasoning", "")),
+        "prompt_b": escape(resolve_prompt(b)),
+        "content_b": escape(b.get("content", "")),
+        "reasoning_b": render_reasoning_block(b.get("reasoning", "")),
+    }
 
 
 def render_record(record: dict, index: int) -> str:
-    rounds = group_rounds(record.get("rounds", []))
-    rounds_html = "\n".join(
+    rounds, totals = summarize_rounds(record.get("rounds", []))
+    rounds_html = "".join(
         render_round_block(idx + 1, r) for idx, r in enumerate(rounds)
     )
 
@@ -131,41 +459,32 @@ def render_record(record: dict, index: int) -> str:
     winner = result.get("winner", "")
     winning_reason = result.get("winning_reason", "")
 
-    total_duration = record.get("total_duration_seconds")
+    total_duration = to_float(record.get("total_duration_seconds"), None)
     duration_line = ""
-    if isinstance(total_duration, (int, float)):
+    if total_duration is not None:
         duration_line = f"<div><strong>Total Duration:</strong> {total_duration:.2f}s</div>"
 
-    totals = {
-        "A": {"cost": 0.0, "tokens": 0},
-        "B": {"cost": 0.0, "tokens": 0},
-    }
-    for item in record.get("rounds", []):
-        side = item.get("side")
-        if side in totals:
-            totals[side]["cost"] += float(item.get("cost") or 0.0)
-            totals[side]["tokens"] += int(item.get("total_tokens") or 0)
-
-    jury_cost = sum(float(item.get("cost") or 0.0) for item in jury_results)
-    jury_tokens = sum(int(item.get("total_tokens") or 0) for item in jury_results)
 
     model_a = record.get("proposition", "")
     model_b = record.get("opposition", "")
     jury_model = record.get("jury", "")
+    esc_model_a = escape(model_a)
+    esc_model_b = escape(model_b)
 
     jury_parsed = jury_parsed_list[0] if jury_parsed_list else {}
     reasoning = jury_parsed.get("reasoning", "")
 
-    total_score_a = 0.0
-    total_score_b = 0.0
-    scored_count = 0
-    for parsed in jury_parsed_list:
-        try:
-            total_score_a += float(parsed.get("total_score_A") or 0.0)
-            total_score_b += float(parsed.get("total_score_B") or 0.0)
-            scored_count += 1
-        except (TypeError, ValueError):
-            continue
+    score_pairs = [
+        (
+            to_float(parsed.get("total_score_A") or 0.0, None),
+            to_float(parsed.get("total_score_B") or 0.0, None),
+        )
+        for parsed in jury_parsed_list
+    ]
+    score_pairs = [pair for pair in score_pairs if None not in pair]
+    total_score_a = sum(score_a for score_a, _ in score_pairs)
+    total_score_b = sum(score_b for _, score_b in score_pairs)
+    scored_count = len(score_pairs)
     avg_score_a = total_score_a / scored_count if scored_count else 0.0
     avg_score_b = total_score_b / scored_count if scored_count else 0.0
 
@@ -175,45 +494,23 @@ def render_record(record: dict, index: int) -> str:
     def build_score_table(details_a: dict, details_b: dict, total_a, total_b) -> str:
         details_a = ensure_dict(details_a)
         details_b = ensure_dict(details_b)
-        score_keys = []
-        for key in details_a.keys():
-            if key not in score_keys:
-                score_keys.append(key)
-        for key in details_b.keys():
-            if key not in score_keys:
-                score_keys.append(key)
-        header_cells = "".join(
-            f"<th>{escape(key.replace('_', ' ').title())}</th>" for key in score_keys
-        )
-        a_cells = "".join(
-            f"<td>{escape(str(details_a.get(key, '')))}</td>" for key in score_keys
-        )
-        b_cells = "".join(
-            f"<td>{escape(str(details_b.get(key, '')))}</td>" for key in score_keys
-        )
-        return f"""
-        <table class="scores">
-          <thead>
-            <tr>
-              <th>Side</th>
-              {header_cells}
-              <th>Total</th>
-            </tr>
-          </thead>
-          <tbody>
-            <tr>
-              <td>Side A ({escape(model_a)})</td>
-              {a_cells}
-              <td>{escape(str(total_a))}</td>
-            </tr>
-            <tr>
-              <td>Side B ({escape(model_b)})</td>
-              {b_cells}
-              <td>{escape(str(total_b))}</td>
-            </tr>
-          </tbody>
-        </table>
-        """
+        score_keys = list(dict.fromkeys([*details_a, *details_b]))
+        headers = escape_many([key.replace("_", " ").title() for key in score_keys])
+        out = ['<table class="scores"><thead><tr><th>Side</th>']
+        out.append("".join(f"<th>{header}</th>" for header in headers))
+        out.append("<th>Total</th></tr></thead><tbody>")
+        for label, esc_model_name, details, total in (
+            ("A", esc_model_a, details_a, total_a),
+            ("B", esc_model_b, details_b, total_b),
+        ):
+            cells = escape_many(
+                [str(details.get(key, "")) for key in score_keys] + [str(total)]
+            )
+            out.append(f"<tr><td>Side {label} ({esc_model_name})</td>")
+            out.append("".join(f"<td>{cell}</td>" for cell in cells))
+            out.append("</tr>")
+        out.append("</tbody></table>")
+        return "".join(out)
 
     per_jury_sections = []
     for idx, parsed in enumerate(jury_parsed_list, start=1):
@@ -226,31 +523,31 @@ def render_record(record: dict, index: int) -> str:
         model_name = ""
         if idx - 1 < len(jury_results):
             model_name = jury_results[idx - 1].get("model", "")
-        summary_block = (
-            f'<div class="jury-reasoning">{escape(judge_summary)}</div>'
-            if judge_summary
-            else ""
-        )
-        reason_block = (
-            f'<div class="jury-winning-reason"><strong>Winning Reason:</strong> {escape(judge_reasoning)}</div>'
-            if judge_reasoning
-            else ""
-        )
         per_jury_sections.append(
-            f"""
-            <div class="panel-title">Jury {idx} ({escape(model_name)})</div>
-            {summary_block}
-            {build_score_table(details_a, details_b, total_a, total_b)}
-            {reason_block}
-            """
+            f'<div class="panel-title">Jury {idx} ({escape(model_name)})</div>'
         )
+        if judge_summary:
+            per_jury_sections.append(
+                f'<div class="jury-reasoning">{escape(judge_summary)}</div>'
+            )
+        per_jury_sections.append(build_score_table(details_a, details_b, total_a, total_b))
+        if judge_reasoning:
+            per_jury_sections.append(
+                '<div class="jury-winning-reason"><strong>Winning Reason:</strong> '
+                f"{escape(judge_reasoning)}</div>"
+            )
     per_jury_tables_html = "".join(per_jury_sections)
 
     debate_id = record.get("id", f"debate-{index}")
+    get = dict.get
+    jury_cost = 0.0
+    jury_tokens = 0
     jury_totals_rows = []
     for idx, item in enumerate(jury_results, start=1):
-        item_tokens = int(item.get("total_tokens") or 0)
-        item_cost = float(item.get("cost") or 0.0)
+        item_tokens = int(to_float(get(item, "total_tokens")))
+        item_cost = to_float(get(item, "cost"))
+        jury_tokens += item_tokens
+        jury_cost += item_cost
         jury_totals_rows.append(
             "<tr>"
             f"<td>Jury {idx} ({escape(str(item.get('model', '')) )})</td>"
@@ -262,211 +559,92 @@ def render_record(record: dict, index: int) -> str:
     total_tokens_all = totals["A"]["tokens"] + totals["B"]["tokens"] + jury_tokens
     total_cost_all = totals["A"]["cost"] + totals["B"]["cost"] + jury_cost
 
-    return f"""
-  <section class="debate" id="debate-{escape(str(debate_id))}">
-    <div class="meta">
-      <div><strong>Topic:</strong> {escape(record.get("topic", ""))}</div>
-      <div><strong>Conditions:</strong> {escape(record.get("conditions", ""))}</div>
-      <div><strong>Model A:</strong> {escape(model_a)}</div>
-      <div><strong>Model B:</strong> {escape(model_b)}</div>
-      <div><strong>Jury:</strong> {escape(jury_model)}</div>
-      {duration_line}
-    </div>
-
-    <div class="general">
-      <div class="panel-title">General Summary</div>
-      <div class="panel-content">{escape(general)}</div>
-    </div>
-
-    <div class="totals-card">
-      <div class="panel-title">Totals</div>
-      <table class="totals">
-        <thead>
-          <tr>
-            <th>Model</th>
-            <th>Total Tokens</th>
-            <th>Total Cost (USD)</th>
-          </tr>
-        </thead>
-        <tbody>
-          <tr>
-            <td>{escape(model_a)}</td>
-            <td>{totals["A"]["tokens"]}</td>
-            <td>{totals["A"]["cost"]:.6f}</td>
-          </tr>
-          <tr>
-            <td>{escape(model_b)}</td>
-            <td>{totals["B"]["tokens"]}</td>
-            <td>{totals["B"]["cost"]:.6f}</td>
-          </tr>
-          {jury_totals_html}
-          <tr>
-            <td><strong>Total</strong></td>
-            <td><strong>{total_tokens_all}</strong></td>
-            <td><strong>{total_cost_all:.6f}</strong></td>
-          </tr>
-        </tbody>
-      </table>
-    </div>
-
-    {rounds_html}
-
-    <div class="jury">
-      <div class="panel-title">Jury Result</div>
-      <div class="panel-content">
-        {per_jury_tables_html}
-        <div class="panel-title">Jury Totals</div>
-        <table class="scores">
-          <thead>
-            <tr>
-              <th></th>
-              <th>Total Score A</th>
-              <th>Total Score B</th>
-            </tr>
-          </thead>
-          <tbody>
-            <tr>
-              <td>Sum</td>
-              <td>{total_score_a:.2f}</td>
-              <td>{total_score_b:.2f}</td>
-            </tr>
-            <tr>
-              <td>Average</td>
-              <td>{avg_score_a:.2f}</td>
-              <td>{avg_score_b:.2f}</td>
-            </tr>
-          </tbody>
-        </table>
-        <div class="winner">Winner: {escape(winner)}</div>
-      </div>
-    </div>
-  </section>
-  """
+    return RECORD_TEMPLATE % {
+        "debate_id": escape(str(debate_id)),
+        "topic": escape(record.get("topic", "")),
+        "conditions": escape(record.get("conditions", "")),
+        "model_a": esc_model_a,
+        "model_b": esc_model_b,
+        "jury_model": escape(jury_model),
+        "duration_line": duration_line,
+        "general": escape(general),
+        "tokens_a": totals["A"]["tokens"],
+        "cost_a": totals["A"]["cost"],
+        "tokens_b": totals["B"]["tokens"],
+        "cost_b": totals["B"]["cost"],
+        "jury_totals_html": jury_totals_html,
+        "total_tokens_all": total_tokens_all,
+        "total_cost_all": total_cost_all,
+        "rounds_html": rounds_html,
+        "per_jury_tables_html": per_jury_tables_html,
+        "total_score_a": total_score_a,
+        "total_score_b": total_score_b,
+        "avg_score_a": avg_score_a,
+        "avg_score_b": avg_score_b,
+        "winner": escape(winner),
+    }
 
 
 def render_human_record(record: dict, index: int) -> str:
     rounds = group_rounds(record.get("rounds", []))
-    round_titles = {
-        1: ("Opening", "Initial arguments without rebuttal."),
-        2: ("Rebuttal", "Direct response to the opposing opening."),
-        3: ("Assumptions", "Analyze framing and hidden assumptions."),
-        4: ("Closing", "Synthesis and final position."),
-    }
-    rounds_html = "\n".join(
-        f"""
-        <div class="round">
-          <div class="round-header">
-            Round {idx + 1} - {escape(round_titles.get(idx + 1, ('Round', ''))[0])}
-            <div class="round-desc">{escape(round_titles.get(idx + 1, ('', ''))[1])}</div>
-          </div>
-          <div class="response-row response-a">
-            <div class="panel side-a">
-              <div class="panel-title">Side A</div>
-              <pre class="model-output">{escape(r.get("A", {}).get("content", ""))}</pre>
-            </div>
-          </div>
-          <div class="response-row response-b">
-            <div class="panel side-b">
-              <div class="panel-title">Side B</div>
-              <pre class="model-output">{escape(r.get("B", {}).get("content", ""))}</pre>
-            </div>
-          </div>
-        </div>
-        """
+    rounds_html = "".join(
+        HUMAN_ROUND_TEMPLATE % {
+            "round_id": idx + 1,
+            "title": escape(ROUND_TITLES.get(idx + 1, ("Round", ""))[0]),
+            "desc": escape(ROUND_TITLES.get(idx + 1, ("", ""))[1]),
+            "content_a": escape(r.get("A", {}).get("content", "")),
+            "content_b": escape(r.get("B", {}).get("content", "")),
+        }
         for idx, r in enumerate(rounds)
     )
-
-    debate_id = record.get("id", f"debate-{index}")
-    conditions = record.get("conditions", "")
-
-    criteria_rows = "\n".join(
-        f"""
-        <tr>
-          <td>{escape(label)}</td>
-          <td><input type="number" name="a_{key}" min="0" max="20" required></td>
-          <td><input type="number" name="b_{key}" min="0" max="20" required></td>
-        </tr>
-        """
-        for key, label in CRITERIA
-    )
-
-
-    return f"""
-  <section class="debate" id="debate-{escape(str(debate_id))}">
-    <div class="meta">
-      <div><strong>Topic:</strong> {escape(record.get("topic", ""))}</div>
-      <div><strong>Conditions:</strong> {escape(conditions)}</div>
-      <div><strong>Participants:</strong> Side A vs Side B</div>
-    </div>
-
-    {rounds_html}
-
-    <form class="human-form" data-debate-id="{escape(str(debate_id))}" data-topic="{escape(record.get("topic", ""))}" data-conditions="{escape(conditions)}">
-      <div class="panel-title">Human Evaluation</div>
-      <table class="scores">
-        <thead>
-          <tr>
-            <th>Criteria</th>
-            <th>Side A (0-20)</th>
-            <th>Side B (0-20)</th>
-          </tr>
-        </thead>
-        <tbody>
-          {criteria_rows}
-        </tbody>
-      </table>
-      <div class="form-row">
-        <label>Winner (auto)</label>
-        <input type="text" name="winner_display" readonly>
-        <input type="hidden" name="winner">
-      </div>
-      <div class="form-row">
-        <label>Why did Side A or Side B win (or why is it a tie)?</label>
-        <textarea name="reasoning" required minlength="20"></textarea>
-      </div>
-      <div class="form-row">
-        <label>Full Name</label>
-        <input type="text" name="full_name" required>
-      </div>
-      <div class="form-row">
-        <label>Email</label>
-        <input type="email" name="email" required>
-      </div>
-      <div class="form-actions">
-        <button type="submit">Submit</button>
-        <span class="form-status" aria-live="polite"></span>
-      </div>
-    </form>
-  </section>
-  """
+    return HUMAN_RECORD_TEMPLATE % {
+        "debate_id": escape(str(record.get("id", f"debate-{index}"))),
+        "topic": escape(record.get("topic", "")),
+        "conditions": escape(record.get("conditions", "")),
+        "rounds_html": rounds_html,
+    }
 
 
-def build_html(records: list, css_href: str) -> str:
-    body = "\n".join(render_record(r, i) for i, r in enumerate(records, start=1))
+def build_topic_map(records: list) -> dict:
     topic_map = {}
     for i, record in enumerate(records, start=1):
-        debate_id = record.get("id", f"debate-{i}")
         topic = record.get("topic", "Untitled")
-        topic_map.setdefault(topic, []).append(debate_id)
+        topic_map.setdefault(topic, []).append(record.get("id", f"debate-{i}"))
+    return topic_map
+
+
+def render_all(render_fn, records: list, workers: int = 1):
+    if workers <= 1:
+        for i, record in enumerate(records, start=1):
+            yield render_fn(record, i)
+        return
+    chunksize = max(1, len(records) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(
+            render_fn, records, range(1, len(records) + 1), chunksize=chunksize
+        )
+
 
+def render_nav(topic_map: dict) -> str:
     nav_groups = []
     for topic, debate_ids in topic_map.items():
-        items_html = "\n".join(
-            f'<button class="nav-item" data-target="debate-{escape(str(d_id))}">{escape(str(d_id))}</button>'
-            for d_id in debate_ids
-        )
-        nav_groups.append(
-            f"""
-            <details class="nav-group">
-              <summary class="nav-group-title">{escape(topic)}</summary>
-              <div class="nav-group-items">
-                {items_html}
-              </div>
-            </details>
-            """
-        )
-    nav_html = "\n".join(nav_groups)
-    return f"""<!doctype html>
+        nav_groups.append('<details class="nav-group"><summary class="nav-group-title">')
+        nav_groups.append(escape(topic))
+        nav_groups.append('</summary><div class="nav-group-items">')
+        for d_id in debate_ids:
+            escaped_id = escape(str(d_id))
+            nav_groups.append('<button class="nav-item" data-target="debate-')
+            nav_groups.append(escaped_id)
+            nav_groups.append('">')
+            nav_groups.append(escaped_id)
+            nav_groups.append("</button>")
+        nav_groups.append("</div></details>")
+    return "".join(nav_groups)
+
+
+def iter_html(records: list, css_href: str, workers: int = 1):
+    nav_html = render_nav(build_topic_map(records))
+    yield f"""<!doctype html>
 <html lang="en">
 <head>
   <meta charset="utf-8" />
@@ -481,74 +659,14 @@ def build_html(records: list, css_href: str) -> str:
       {nav_html}
     </aside>
     <main class="content">
-      {body}
-      <footer class="signature">
-        Fatih Tatoğlu - <a href="https://tatoglu.net" target="_blank" rel="noopener">https://tatoglu.net</a>
-      </footer>
-    </main>
-  </div>
-  <script>
-    const items = document.querySelectorAll('.nav-item');
-    const debates = document.querySelectorAll('.debate');
-    function showDebate(id) {{
-      debates.forEach((el) => {{
-        el.style.display = el.id === id ? 'block' : 'none';
-      }});
-      items.forEach((btn) => {{
-        btn.classList.toggle('active', btn.dataset.target === id);
-      }});
-    }}
-    if (items.length) {{
-      showDebate(items[0].dataset.target);
-      items.forEach((btn) => {{
-        btn.addEventListener('click', () => showDebate(btn.dataset.target));
-      }});
-    }}
-  </script>
-</body>
-</html>
 """
+    yield from render_all(render_record, records, workers)
+    yield SIGNATURE_HTML + MAIN_SCRIPT + "</body>\n</html>\n"
 
 
-def build_human_html(records: list, css_href: str) -> str:
-    body = "\n".join(
-        render_human_record(r, i) for i, r in enumerate(records, start=1)
-    )
-    topic_map = {}
-    for i, record in enumerate(records, start=1):
-        debate_id = record.get("id", f"debate-{i}")
-        topic = record.get("topic", "Untitled")
-        topic_map.setdefault(topic, []).append(debate_id)
-
-    nav_groups = []
-    for topic, debate_ids in topic_map.items():
-        items_html = "\n".join(
-            f'<button class="nav-item" data-target="debate-{escape(str(d_id))}">{escape(str(d_id))}</button>'
-            for d_id in debate_ids
-        )
-        nav_groups.append(
-            f"""
-            <details class="nav-group">
-              <summary class="nav-group-title">{escape(topic)}</summary>
-              <div class="nav-group-items">
-                {items_html}
-              </div>
-            </details>
-            """
-        )
-    nav_html = "\n".join(nav_groups)
-
-    score_js_lines = []
-    for key, _label in CRITERIA:
-        score_js_lines.append(
-            f"scores.side_a['{key}'] = Number(data.get('a_{key}'));"
-        )
-        score_js_lines.append(
-            f"scores.side_b['{key}'] = Number(data.get('b_{key}'));"
-        )
-    score_js = "\n        ".join(score_js_lines)
-
-    return f"""<!doctype html>
+def iter_human_html(records: list, css_href: str, workers: int = 1):
+    nav_html = render_nav(build_topic_map(records))
+    yield f"""<!doctype html>
 <html lang="en">
 <head>
   <meta charset="utf-8" />
@@ -563,112 +681,73 @@ def build_human_html(records: list, css_href: str) -> str:
       {nav_html}
     </aside>
     <main class="content">
-      {body}
-      <footer class="signature">
-        Fatih Tatoğlu - <a href="https://tatoglu.net" target="_blank" rel="noopener">https://tatoglu.net</a>
-      </footer>
-    </main>
-  </div>
-  <script>
-    const items = document.querySelectorAll('.nav-item');
-    const debates = document.querySelectorAll('.debate');
-    function showDebate(id) {{
-      debates.forEach((el) => {{
-        el.style.display = el.id === id ? 'block' : 'none';
-      }});
-      items.forEach((btn) => {{
-        btn.classList.toggle('active', btn.dataset.target === id);
-      }});
-    }}
-    if (items.length) {{
-      showDebate(items[0].dataset.target);
-      items.forEach((btn) => {{
-        btn.addEventListener('click', () => showDebate(btn.dataset.target));
-      }});
-    }}
-
-    document.querySelectorAll('.human-form').forEach((form) => {{
-      form.addEventListener('submit', async (e) => {{
-        e.preventDefault();
-        const status = form.querySelector('.form-status');
-        status.textContent = 'Submitting...';
-        const data = new FormData(form);
-        const payload = {{
-          debate_id: form.dataset.debateId,
-          topic: form.dataset.topic,
-          conditions: form.dataset.conditions,
-          scores: {{
-            side_a: {{}},
-            side_b: {{}},
-          }},
-          winner: data.get('winner'),
-          reasoning: data.get('reasoning'),
-          full_name: data.get('full_name'),
-          email: data.get('email'),
-        }};
-        const scores = payload.scores;
-        {score_js}
-        try {{
-          const res = await fetch('https://example.com/submit', {{
-            method: 'POST',
-            headers: {{ 'Content-Type': 'application/json' }},
-            body: JSON.stringify(payload),
-          }});
-          if (res.ok) {{
-            status.textContent = 'Submitted.';
-            form.reset();
-          }} else {{
-            status.textContent = 'Failed. Please try again.';
-          }}
-        }} catch (err) {{
-          status.textContent = 'Failed. Please try again.';
-        }}
-      }});
-    }});
-
-    function updateWinner(form) {{
-      const data = new FormData(form);
-      let totalA = 0;
-      let totalB = 0;
-      const scores = {{ side_a: {{}}, side_b: {{}} }};
-      {score_js}
-      Object.values(scores.side_a).forEach((v) => totalA += v);
-      Object.values(scores.side_b).forEach((v) => totalB += v);
-      const winnerField = form.querySelector('input[name="winner"]');
-      const winnerDisplay = form.querySelector('input[name="winner_display"]');
-      if (totalA > totalB) {{
-        winnerField.value = 'Side A';
-        winnerDisplay.value = 'Side A';
-      }} else if (totalB > totalA) {{
-        winnerField.value = 'Side B';
-        winnerDisplay.value = 'Side B';
-      }} else {{
-        winnerField.value = 'Tie';
-        winnerDisplay.value = 'Tie';
-      }}
-    }}
-
-    document.querySelectorAll('.human-form').forEach((form) => {{
-      form.addEventListener('input', () => updateWinner(form));
-      updateWinner(form);
-    }});
-  </script>
-</body>
-</html>
 """
+    yield from render_all(render_human_record, records, workers)
+    yield SIGNATURE_HTML + HUMAN_SCRIPT + "</body>\n</html>\n"
+
+
+def compact_markup(text: str) -> str:
+    restore = []
+    code = 0xE000
+    # A lone whitespace character between words is kept, since it shows in
+    # pre-wrap text; longer runs collapse to a space and vanish between tags.
+    for char in [char for char in NON_SPACE_WHITESPACE if char in text]:
+        pieces = text.split(char)
+        kept = [
+            index
+            for index, (previous, piece) in enumerate(zip(pieces, pieces[1:]), 1)
+            if piece and previous
+            and not piece[0].isspace()
+            and not previous[-1].isspace()
+            and not (previous[-1] == ">" and piece[0] == "<")
+        ]
+        if not kept:
+            continue
+        while chr(code) in text:
+            code += 1
+        marker = chr(code)
+        code += 1
+        for index in kept:
+            pieces[index] = marker + pieces[index]
+        text = char.join(pieces)
+        restore.append((" " + marker, char))
+    compact = " ".join(text.split()).replace("> <", "><")
+    for marked, char in restore:
+        compact = compact.replace(marked, char)
+    return compact
 
 
 def minify_html(html_text: str) -> str:
-    parts = re.split(r"(<pre.*?>.*?</pre>)", html_text, flags=re.DOTALL)
     out = []
-    for part in parts:
-        if part.startswith("<pre"):
-            out.append(part)
-            continue
-        compact = re.sub(r">\s+<", "><", part)
-        compact = re.sub(r"\s{2,}", " ", compact)
-        out.append(compact.strip())
-    return "".join(out)
+    position = 0
+    while True:
+        start = html_text.find("<pre", position)
+        end = html_text.find("</pre>", start) if start != -1 else -1
+        if end == -1:
+            out.append(compact_markup(html_text[position:]))
+            return "".join(out)
+        end += len("</pre>")
+        out.append(compact_markup(html_text[position:start]))
+        out.append(html_text[start:end])
+        position = end
+
+
+def minify_chunks(chunks):
+    for chunk in chunks:
+        yield minify_html(chunk)
+
+
+def write_html(path: Path, chunks, compress: bool = False) -> Path:
+    if compress:
+        path = path.with_name(path.name + ".gz")
+        with gzip.open(path, "wb", compresslevel=6) as f:
+            for chunk in chunks:
+                f.write(chunk.encode("utf-8"))
+        return path
+    with path.open("wb", buffering=1 << 20) as f:
+        for chunk in minify_chunks(chunks):
+            f.write(chunk.encode("utf-8"))
+    return path
 
 
 def main() -> None:
@@ -686,17 +765,34 @@ def main() -> None:
         default=Path("outputs/human.html"),
         help="Output HTML file path for human review.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of processes used to render debates (default: 1).",
+    )
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="Write gzip-compressed .html.gz files instead of minified HTML.",
+    )
     args = parser.parse_args()
 
     records = load_records(args.input)
     css_href_main = os.path.relpath(Path("styles.css"), args.output.parent)
     css_href_human = os.path.relpath(Path("styles.css"), args.human_output.parent)
-    html_text = build_html(records, css_href_main)
-    human_html_text = build_human_html(records, css_href_human)
-    args.output.write_text(minify_html(html_text), encoding="utf-8")
-    args.human_output.write_text(minify_html(human_html_text), encoding="utf-8")
-    print(f"HTML written to {args.output}")
-    print(f"Human HTML written to {args.human_output}")
+    output_path = write_html(
+        args.output,
+        iter_html(records, css_href_main, args.workers),
+        args.gzip,
+    )
+    human_output_path = write_html(
+        args.human_output,
+        iter_human_html(records, css_href_human, args.workers),
+        args.gzip,
+    )
+    print(f"HTML written to {output_path}")
+    print(f"Human HTML written to {human_output_path}")
 
 
 if __name__ == "__main__":